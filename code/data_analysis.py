@@ -83,7 +83,7 @@ def plot_opening_move(first_moves, white_win, win_ratio):
     plt.savefig('opening_move.png')
 
 
-def piece_value(games):
+def piece_value(games, engine_command='stockfish'):
     """
     Returns a dictionary of all the piece types and their aggregate positional
     evaluation scores from all the games in the given dataset. Utilizes
@@ -91,9 +91,10 @@ def piece_value(games):
     account casting (giving points to both the King and Rook) and promotions
     (giving points to the pawn). Also takes into account color moving ensuring
     proper point evaluation.
-    Input: a dataframe of chess games.
+    Input: a dataframe of chess games and the command used to start the
+    UCI chess engine (a path or a list of arguments, defaults to stockfish).
     """
-    engine = chess.engine.SimpleEngine.popen_uci('stockfish')
+    engine = chess.engine.SimpleEngine.popen_uci(engine_command)
     pieces = {'P': 0, 'N': 0, 'B': 0, 'R': 0, 'Q': 0, 'K': 0}
     board = chess.Board()
     for game in games:
@@ -24,7 +24,7 @@ def run_plot_opening_move(data):
     data_analysis.plot_opening_move(first_moves, white_win, win_ratio)
 
 
-def run_piece_value(data):
+def run_piece_value(data, engine_command='stockfish'):
     """
     Runs the piece_value and plot_piece_value method
     from data_analysis. Can uncomment print statements in
@@ -32,8 +32,11 @@ def run_piece_value(data):
     used to calcualte each piece value. Best validation on
     clean_test1 data since a lot of information is shown.
     Runtime with clean_data_ma (132 games) took 20 minutes.
+    Pass the material_engine stand-in as the engine_command
+    (e.g. ['python', 'code/material_engine.py']) to time the
+    pipeline without stockfish.
     """
-    evaluation = data_analysis.piece_value(data['moves'])
+    evaluation = data_analysis.piece_value(data['moves'], engine_command)
     print('')
     print('Results from piece_value method')
     print('Piece evaluation:', evaluation)
@@ -0,0 +1,142 @@
+"""
+A small stand-in chess engine that speaks the UCI protocol. Returns fast
+and deterministic scores from a material and mobility count (or from a
+lookup table of positions) so piece_value can be tested and benchmarked
+without stockfish.
+Usage: python material_engine.py [--table TABLE.csv] [--latency SECONDS]
+"""
+import argparse
+import csv
+import sys
+import time
+import chess
+
+PIECE_VALUES = {chess.PAWN: 100, chess.KNIGHT: 300, chess.BISHOP: 300,
+                chess.ROOK: 500, chess.QUEEN: 900, chess.KING: 0}
+
+
+def load_table(filepath):
+    """
+    Returns a dictionary of positions (FEN without the move counters)
+    and their UCI score strings from White's POV, such as 'cp 35' or
+    'mate -2'.
+    Input: filepath to a CSV file with the columns fen and score.
+    """
+    table = {}
+    with open(filepath, newline='') as f:
+        for row in csv.DictReader(f):
+            table[position_key(chess.Board(row['fen']))] = row['score']
+    return table
+
+
+def position_key(board):
+    """
+    Returns the FEN of the board without the halfmove and fullmove
+    counters so transpositions share a table entry.
+    Input: a chess.Board.
+    """
+    return ' '.join(board.fen().split()[:4])
+
+
+def mobility(board, color):
+    """
+    Returns the number of legal moves the given color would have
+    in the current position.
+    Input: a chess.Board and the color (chess.WHITE or chess.BLACK).
+    """
+    if board.turn == color:
+        return board.legal_moves.count()
+    board = board.copy(stack=False)
+    board.push(chess.Move.null())
+    return board.legal_moves.count()
+
+
+def evaluate(board, table=None):
+    """
+    Returns the UCI score string of the position from the side to move's
+    POV. Checkmates score as 'mate 0' and draws as 'cp 0'. Positions in
+    the table use their stored score, everything else is scored as
+    material (in centi-pawns) plus the difference in mobility.
+    Input: a chess.Board and an optional table from load_table.
+    """
+    if board.is_checkmate():
+        return 'mate 0'
+    if board.is_stalemate() or board.is_insufficient_material():
+        return 'cp 0'
+    sign = 1 if board.turn == chess.WHITE else -1
+    if table and position_key(board) in table:
+        kind, value = table[position_key(board)].split()
+        return kind + ' ' + str(int(value) * sign)
+    score = 0
+    for piece in board.piece_map().values():
+        value = PIECE_VALUES[piece.piece_type]
+        score += value if piece.color == chess.WHITE else -value
+    score += mobility(board, chess.WHITE) - mobility(board, chess.BLACK)
+    return 'cp ' + str(score * sign)
+
+
+def set_position(tokens):
+    """
+    Returns the chess.Board described by a UCI position command.
+    Input: the tokens of the command after 'position'.
+    """
+    if 'moves' in tokens:
+        index = tokens.index('moves')
+        setup, moves = tokens[:index], tokens[index + 1:]
+    else:
+        setup, moves = tokens, []
+    if setup[0] == 'fen':
+        board = chess.Board(' '.join(setup[1:]))
+    else:
+        board = chess.Board()
+    for move in moves:
+        board.push_uci(move)
+    return board
+
+
+def run(table=None, latency=0.0, stdin=sys.stdin, stdout=sys.stdout):
+    """
+    Reads UCI commands until 'quit' and answers them. Every 'go' command
+    is answered with a single depth 1 score after waiting latency seconds.
+    Input: an optional table from load_table, the latency in seconds and
+    the input and output streams.
+    """
+    board = chess.Board()
+    for line in stdin:
+        tokens = line.split()
+        if not tokens:
+            continue
+        command = tokens[0]
+        if command == 'uci':
+            print('id name MaterialEngine', file=stdout)
+            print('id author Chess_Openings', file=stdout)
+            print('uciok', file=stdout)
+        elif command == 'isready':
+            print('readyok', file=stdout)
+        elif command == 'ucinewgame':
+            board = chess.Board()
+        elif command == 'position':
+            board = set_position(tokens[1:])
+        elif command == 'go':
+            time.sleep(latency)
+            print('info depth 1 score', evaluate(board, table), file=stdout)
+            best = next(iter(board.legal_moves), None)
+            print('bestmove', best.uci() if best else '(none)', file=stdout)
+        elif command == 'quit':
+            break
+        stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Stand-in UCI engine scoring positions by material.')
+    parser.add_argument('--table', help='CSV file of fen,score overrides')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds to wait before answering go')
+    args = parser.parse_args()
+    table = load_table(args.table) if args.table else None
+    run(table, args.latency)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,19 @@
 """
 Provides a test suite to validate the program.
 """
+import os
+import sys
 from cse163_utils import assert_equals
 import pandas as pd
 import data_cleanse
 import data_analysis
 import ml
 
+# stand-in UCI engine so the piece value test runs without stockfish
+ENGINE = [sys.executable,
+          os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       'material_engine.py')]
+
 
 def test_data_cleanse(ori_test30, clean_test30):
     """
@@ -38,9 +45,10 @@ def test_opening_move(clean_test30):
 
 def test_piece_value(chess_games):
     """
-    Tests the piece_value method from data_analysis.
+    Tests the piece_value method from data_analysis
+    using the material_engine stand-in.
     """
-    pieces = data_analysis.piece_value(chess_games['moves'])
+    pieces = data_analysis.piece_value(chess_games['moves'], ENGINE)
     for piece, score in pieces.items():
         if (piece == 'P') | (piece == 'N'):
             assert(score != 0)